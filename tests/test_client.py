@@ -1,47 +1,50 @@
 import pytest
-import random
+import requests
+import uuid
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
 from io import BytesIO
 
 from walrus.client import WalrusClient, WalrusAPIError
 
+UPLOAD_KINDS = ["bytes", "file", "stream"]
+
 
 @pytest.fixture(scope="session")
 def client():
     """Create a WalrusClient instance that's reused across all tests."""
     publisher_url = "https://publisher.testnet.walrus.atalma.io/"
     aggregator_url = "https://aggregator.walrus-testnet.walrus.space/"
-    return WalrusClient(publisher_url, aggregator_url)
-
+    with WalrusClient(publisher_url, aggregator_url) as c:
+        # Warm up the connection pool so the first test doesn't pay the TLS handshake
+        for base_url in (c.publisher_base_url, c.aggregator_base_url):
+            try:
+                c._session.head(base_url, timeout=5)
+            except requests.RequestException:
+                pass
 
-@pytest.fixture(scope="session")
-def string_data():
-    """Generate random string data for testing."""
-    random_number = random.randint(10000, 99999)
-    return f"some string with random number: {random_number}".encode("utf-8")
+        yield c
 
 
 @pytest.fixture(scope="session")
-def file_data(tmp_path_factory):
-    """Generate a temporary file with random content for testing."""
-    temp_dir = tmp_path_factory.mktemp("test_data")
-    file_path = temp_dir / "test_file.txt"
-
-    random_number = random.randint(10000, 99999)
-    content = f"file content with random number: {random_number}"
-
-    with open(file_path, "w") as f:
-        f.write(content)
-
-    return file_path
+def shared_tmp(tmp_path_factory):
+    """Create a single temporary directory shared by all tests in the session."""
+    return tmp_path_factory.mktemp("walrus")
 
 
 @pytest.fixture(scope="session")
-def stream_data():
-    """Generate a BytesIO stream with random content for testing."""
-    random_number = random.randint(10000, 99999)
-    content = f"stream content with random number: {random_number}"
+def payloads(shared_tmp):
+    """Build the bytes, file and stream payloads from a single per-session token."""
+    token = uuid.uuid4().hex
+
+    file_path = shared_tmp / "test_file.txt"
+    file_path.write_bytes(f"file content with token: {token}".encode("utf-8"))
 
-    return BytesIO(content.encode("utf-8"))
+    return {
+        "bytes": f"some string with token: {token}".encode("utf-8"),
+        "file": file_path,
+        "stream": f"stream content with token: {token}".encode("utf-8"),
+    }
 
 
 class BlobFixtureFactory:
@@ -65,112 +68,131 @@ class BlobFixtureFactory:
 
         return {"object_id": blob_object_id, "blob_id": blob_id}
 
-
-@pytest.fixture(scope="session")
-def blob_info(client, string_data):
-    """Upload a blob and return its IDs and original content."""
-    info = BlobFixtureFactory.create_blob_info(
-        client, string_data, client.put_blob, deletable=True
-    )
-    info["original_content"] = string_data
-    return info
+    @staticmethod
+    def upload(client, payloads, kind):
+        """Upload the payload of the given kind and return its IDs and content."""
+        if kind == "bytes":
+            data, content = payloads["bytes"], payloads["bytes"]
+            upload_method = client.put_blob
+        elif kind == "file":
+            data, content = payloads["file"], payloads["file"].read_bytes()
+            upload_method = client.put_blob_from_file
+        else:
+            data, content = BytesIO(payloads["stream"]), payloads["stream"]
+            upload_method = client.put_blob_from_stream
+
+        info = BlobFixtureFactory.create_blob_info(
+            client, data, upload_method, deletable=True
+        )
+        info["content"] = content
+        return info
 
 
 @pytest.fixture(scope="session")
-def file_blob_info(client, file_data):
-    """Upload a file and return its IDs and content."""
-    info = BlobFixtureFactory.create_blob_info(
-        client, file_data, client.put_blob_from_file, deletable=True
-    )
+def uploads(client, payloads):
+    """Return a getter that uploads each payload kind at most once per session."""
+    cache = {}
 
-    # Store original file content
-    with open(file_data, "r") as f:
-        info["file_content"] = f.read()
+    def get(kind):
+        if kind not in cache:
+            cache[kind] = BlobFixtureFactory.upload(client, payloads, kind)
+        return cache[kind]
 
-    return info
+    return get
 
 
-@pytest.fixture(scope="session")
-def stream_blob_info(client, stream_data):
-    """Upload from a stream and return its IDs and content."""
-    # Reset stream position and store content
-    stream_data.seek(0)
-    stream_content = stream_data.getvalue().decode("utf-8")
+@pytest.fixture(params=UPLOAD_KINDS, ids=lambda p: p)
+def uploaded_blob(request, uploads):
+    """Return the uploaded blob for each payload kind."""
+    return uploads(request.param)
 
-    # Reset stream position for upload
-    stream_data.seek(0)
 
-    info = BlobFixtureFactory.create_blob_info(
-        client, stream_data, client.put_blob_from_stream, deletable=True
-    )
+@pytest.fixture(scope="session")
+def batch_blobs(client, payloads):
+    """Upload two blobs with put_blobs and return their IDs and contents."""
+    batch = [payloads["bytes"] + b" (batch 1)", payloads["bytes"] + b" (batch 2)"]
+    responses = client.put_blobs(batch, deletable=True)
+    assert len(responses) == len(batch), "Should get one response per blob"
 
-    info["stream_content"] = stream_content
-    return info
+    return [
+        {"blob_id": response["newlyCreated"]["blobObject"]["blobId"], "content": data}
+        for response, data in zip(responses, batch)
+    ]
 
 
 class TestBlobUpload:
     """Tests for blob upload functionality."""
 
-    def test_put_blob(self, blob_info):
-        """Verify blob was uploaded correctly."""
-        assert blob_info["object_id"], "Blob object ID should exist"
-        assert blob_info["blob_id"], "Blob ID should exist"
+    def test_put_blob(self, uploaded_blob):
+        """Verify each payload kind was uploaded correctly."""
+        assert uploaded_blob["object_id"], "Blob object ID should exist"
+        assert uploaded_blob["blob_id"], "Blob ID should exist"
+
 
-    def test_put_blob_from_file(self, file_blob_info):
-        """Verify file blob was uploaded correctly."""
-        assert file_blob_info["object_id"], "Blob object ID should exist"
-        assert file_blob_info["blob_id"], "Blob ID should exist"
+class TestBatchOperations:
+    """Tests for concurrent batch upload and retrieval."""
 
-    def test_put_blob_from_stream(self, stream_blob_info):
-        """Verify stream blob was uploaded correctly."""
-        assert stream_blob_info["object_id"], "Blob object ID should exist"
-        assert stream_blob_info["blob_id"], "Blob ID should exist"
+    def test_put_blobs(self, client, batch_blobs):
+        """Verify several blobs are uploaded and responses keep input order."""
+        for blob in batch_blobs:
+            assert (
+                client.get_blob(blob["blob_id"]) == blob["content"]
+            ), "Content doesn't match"
+
+    def test_get_blobs(self, client, batch_blobs):
+        """Test retrieving several blobs concurrently."""
+        contents = client.get_blobs([blob["blob_id"] for blob in batch_blobs])
+        assert contents == [
+            blob["content"] for blob in batch_blobs
+        ], "Retrieved contents don't match originals"
 
 
 class TestBlobRetrieval:
     """Tests for blob retrieval functionality."""
 
-    def test_get_blob_by_object_id(self, client, blob_info):
+    def test_get_blob_by_object_id(self, client, uploads):
         """Test retrieving a blob using its object ID."""
-        response = client.get_blob_by_object_id(blob_info["object_id"])
-        assert (
-            response == blob_info["original_content"]
-        ), "Retrieved content doesn't match original"
+        blob = uploads("bytes")
+        response = client.get_blob_by_object_id(blob["object_id"])
+        assert response == blob["content"], "Retrieved content doesn't match original"
 
-    def test_get_blob(self, client, blob_info):
+    def test_get_blob(self, client, uploads):
         """Test retrieving a blob using its blob ID."""
-        response = client.get_blob(blob_info["blob_id"])
-        assert (
-            response == blob_info["original_content"]
-        ), "Retrieved content doesn't match original"
+        blob = uploads("bytes")
+        response = client.get_blob(blob["blob_id"])
+        assert response == blob["content"], "Retrieved content doesn't match original"
 
-    def test_get_blob_metadata(self, client, blob_info):
+    def test_get_blob_metadata(self, client, uploads):
         """Test retrieving blob metadata."""
-        response = client.get_blob_metadata(blob_info["blob_id"])
+        blob = uploads("bytes")
+        response = client.get_blob_metadata(blob["blob_id"])
         assert response is not None, "Should get a valid response"
-        assert response["etag"] == blob_info["blob_id"], "Etag should match blob ID"
+        assert response["etag"] == blob["blob_id"], "Etag should match blob ID"
 
-    def test_get_blob_as_file(self, client, file_blob_info, tmp_path):
+    def test_get_blob_as_file(self, client, uploads, shared_tmp):
         """Test retrieving a file blob to disk."""
-        file_path = tmp_path / "downloaded_file.txt"
-        client.get_blob_as_file(file_blob_info["blob_id"], str(file_path))
-
-        with open(file_path, "r") as f:
-            downloaded_content = f.read()
+        blob = uploads("file")
+        file_path = shared_tmp / "downloaded_file.txt"
+        client.get_blob_as_file(blob["blob_id"], str(file_path))
 
         assert (
-            downloaded_content == file_blob_info["file_content"]
+            file_path.read_bytes() == blob["content"]
         ), "Downloaded content doesn't match original"
 
-    def test_get_blob_as_stream(self, client, stream_blob_info):
+    def test_get_blob_as_stream(self, client, uploads):
         """Test retrieving a blob as a stream."""
-        response = client.get_blob_as_stream(stream_blob_info["blob_id"])
+        blob = uploads("stream")
+        response = client.get_blob_as_stream(blob["blob_id"])
         assert response is not None, "Should get a valid response"
 
-        content = response.read().decode("utf-8")
-        assert (
-            content == stream_blob_info["stream_content"]
-        ), "Stream content doesn't match original"
+        content = response.read()
+        assert content == blob["content"], "Stream content doesn't match original"
+
+    def test_iter_blob(self, client, uploads):
+        """Test retrieving a blob as an iterator of chunks."""
+        blob = uploads("stream")
+        content = b"".join(client.iter_blob(blob["blob_id"], chunk_size=8))
+        assert content == blob["content"], "Iterated content doesn't match original"
 
 
 class TestErrorHandling:
@@ -216,3 +238,246 @@ class TestErrorHandling:
         error = exc_info.value
         assert error.code == 404
         assert error.status == "Not Found"
+
+    def test_iter_blob_404(self, client):
+        """Test proper error handling when iterating a non-existent blob."""
+        with pytest.raises(WalrusAPIError) as exc_info:
+            list(client.iter_blob(self.NONEXISTENT_BLOB_ID))
+
+        error = exc_info.value
+        assert error.code == 404
+        assert error.status == "NOT_FOUND"
+
+
+STUB_URL = "http://walrus.test"
+
+
+class StubAdapter(BaseAdapter):
+    """Transport adapter that records requests and replies with a canned response."""
+
+    def __init__(self, status_code=200, body=b"{}", reason="OK"):
+        super().__init__()
+        self.status_code = status_code
+        self.body = body
+        self.reason = reason
+        self.requests = []
+        self.closed = False
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.reason = self.reason
+        response.headers = CaseInsensitiveDict()
+        response._content = self.body
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def stub_adapter():
+    """Create a stub adapter that answers every request with an empty JSON object."""
+    return StubAdapter()
+
+
+@pytest.fixture
+def stub_client(stub_adapter):
+    """Create a WalrusClient whose requests are served by the stub adapter."""
+    session = requests.Session()
+    session.mount(STUB_URL, stub_adapter)
+    with WalrusClient(STUB_URL, STUB_URL, session=session) as c:
+        yield c
+
+
+def _write_file(tmp_path, content):
+    file_path = tmp_path / "upload.bin"
+    file_path.write_bytes(content)
+    return str(file_path)
+
+
+class TestRequestHeaders:
+    """Offline tests for the length headers sent with blob uploads."""
+
+    @pytest.mark.parametrize(
+        "make_data, content_length, transfer_encoding",
+        [
+            (lambda tmp_path: b"abc", "3", None),
+            (lambda tmp_path: b"", "0", None),
+            (lambda tmp_path: bytearray(), "0", None),
+            (lambda tmp_path: memoryview(b""), "0", None),
+            (lambda tmp_path: memoryview(bytearray(8)).cast("I"), "8", None),
+            (lambda tmp_path: BytesIO(b"abc"), "3", None),
+            (lambda tmp_path: BytesIO(b""), None, "chunked"),
+            (lambda tmp_path: _write_file(tmp_path, b"file content"), "12", None),
+            (lambda tmp_path: _write_file(tmp_path, b""), "0", None),
+        ],
+        ids=[
+            "bytes",
+            "empty-bytes",
+            "empty-bytearray",
+            "empty-memoryview",
+            "memoryview-items",
+            "stream",
+            "empty-stream",
+            "file",
+            "empty-file",
+        ],
+    )
+    def test_put_blob_length_headers(
+        self,
+        stub_client,
+        stub_adapter,
+        tmp_path,
+        make_data,
+        content_length,
+        transfer_encoding,
+    ):
+        """Each body type is sent with exactly the expected length headers."""
+        stub_client.put_blob(make_data(tmp_path))
+
+        headers = stub_adapter.requests[-1].headers
+        assert headers.get("Content-Length") == content_length
+        assert headers.get("Transfer-Encoding") == transfer_encoding
+
+
+class TestResponseParsing:
+    """Offline tests for decoding publisher responses."""
+
+    def test_put_blob_returns_json(self, stub_client, stub_adapter):
+        """A JSON body is returned as a dict."""
+        stub_adapter.body = b'{"newlyCreated": {"blobObject": {"blobId": "abc"}}}'
+        response = stub_client.put_blob(b"data")
+        assert response == {"newlyCreated": {"blobObject": {"blobId": "abc"}}}
+
+    def test_put_blob_non_json_body(self, stub_client, stub_adapter):
+        """A successful status with a non-JSON body raises WalrusAPIError."""
+        stub_adapter.body = b"<html>proxy error</html>"
+        with pytest.raises(WalrusAPIError) as exc_info:
+            stub_client.put_blob(b"data")
+
+        assert exc_info.value.status == "REQUEST_FAILED"
+
+
+class TestSessionOwnership:
+    """Offline tests for closing the client's HTTP session."""
+
+    def test_close_leaves_injected_session_open(self, stub_adapter):
+        """Closing a client does not close a session passed in by the caller."""
+        session = requests.Session()
+        session.mount(STUB_URL, stub_adapter)
+        with WalrusClient(STUB_URL, STUB_URL, session=session):
+            pass
+
+        assert not stub_adapter.closed, "Injected session should stay open"
+
+    def test_close_closes_owned_session(self, stub_adapter):
+        """Closing a client closes the session it created."""
+        client = WalrusClient(STUB_URL, STUB_URL)
+        client._session.mount(STUB_URL, stub_adapter)
+        client.close()
+
+        assert stub_adapter.closed, "Owned session should be closed"
+
+    def test_worker_count_capped_by_own_pool(self):
+        """Batch concurrency is capped at pool_size for the client's own session."""
+        client = WalrusClient(STUB_URL, STUB_URL, pool_size=4)
+        assert client._worker_count(16) == 4
+
+    def test_worker_count_with_injected_session(self):
+        """pool_size does not cap batch concurrency for an injected session."""
+        client = WalrusClient(
+            STUB_URL, STUB_URL, session=requests.Session(), pool_size=4
+        )
+        assert client._worker_count(16) == 16
+
+
+class TestPutBlobDispatch:
+    """Offline tests for the data types accepted by put_blob."""
+
+    @pytest.mark.parametrize("as_str", [True, False], ids=["str", "pathlike"])
+    def test_put_blob_from_path(self, stub_client, stub_adapter, tmp_path, as_str):
+        """A path is opened and its contents are sent."""
+        file_path = tmp_path / "upload.bin"
+        file_path.write_bytes(b"file content")
+        stub_client.put_blob(str(file_path) if as_str else file_path)
+
+        body = stub_adapter.requests[-1].body
+        assert body.name == str(file_path), "File handle should be sent as the body"
+
+    def test_put_blob_from_stream(self, stub_client, stub_adapter):
+        """A stream is passed through as the request body."""
+        stream = BytesIO(b"stream content")
+        stub_client.put_blob(stream)
+
+        assert stub_adapter.requests[-1].body is stream
+
+    def test_put_blob_rejects_text(self, stub_client, stub_adapter):
+        """A str that is not an existing file raises TypeError without the payload."""
+        payload = "some text that is not a path"
+        with pytest.raises(TypeError) as exc_info:
+            stub_client.put_blob(payload)
+
+        assert payload not in str(exc_info.value)
+        assert not stub_adapter.requests, "Nothing should be sent"
+
+    def test_put_blob_from_file_missing(self, stub_client, tmp_path):
+        """put_blob_from_file still raises FileNotFoundError for missing paths."""
+        with pytest.raises(FileNotFoundError):
+            stub_client.put_blob_from_file(str(tmp_path / "missing.bin"))
+
+
+class TestErrorParsing:
+    """Offline tests for turning error responses into WalrusAPIError."""
+
+    @pytest.mark.parametrize(
+        "body",
+        [b'{"error": "string"}', b"[1]", b"", b"<html>Not Found</html>"],
+        ids=["error-string", "json-list", "empty", "html"],
+    )
+    def test_unstructured_error_falls_back_to_http(
+        self, stub_client, stub_adapter, body
+    ):
+        """Bodies without a structured error fall back to the HTTP status."""
+        stub_adapter.status_code, stub_adapter.reason = 404, "Not Found"
+        stub_adapter.body = body
+        with pytest.raises(WalrusAPIError) as exc_info:
+            stub_client.get_blob("missing")
+
+        error = exc_info.value
+        assert error.code == 404
+        assert error.status == "Not Found"
+        assert error.details == []
+
+    def test_structured_error(self, stub_client, stub_adapter):
+        """A structured error body is exposed on WalrusAPIError."""
+        stub_adapter.status_code, stub_adapter.reason = 404, "Not Found"
+        stub_adapter.body = (
+            b'{"error": {"code": 404, "status": "NOT_FOUND",'
+            b' "message": "blob not found", "details": [{"reason": "x"}]}}'
+        )
+        with pytest.raises(WalrusAPIError) as exc_info:
+            stub_client.get_blob("missing")
+
+        error = exc_info.value
+        assert error.code == 404
+        assert error.status == "NOT_FOUND"
+        assert error.message == "blob not found"
+        assert error.details == [{"reason": "x"}]
+        assert isinstance(error.__cause__, requests.HTTPError)
+
+    def test_network_error(self, stub_client, stub_adapter, monkeypatch):
+        """Failures without a response are reported as REQUEST_FAILED."""
+
+        def fail(request, **kwargs):
+            raise requests.ConnectionError("connection refused")
+
+        monkeypatch.setattr(stub_adapter, "send", fail)
+        with pytest.raises(WalrusAPIError) as exc_info:
+            stub_client.get_blob("missing")
+
+        assert exc_info.value.code == 500
+        assert exc_info.value.status == "REQUEST_FAILED"
@@ -1,7 +1,35 @@
 import os
-from typing import Dict, Optional, Any, BinaryIO, IO
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Dict,
+    Optional,
+    Any,
+    BinaryIO,
+    IO,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+    Union,
+)
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    _loads = json.loads
+
+_BOOL_STR = ("false", "true")
 
 
 class WalrusAPIError(RequestException):
@@ -33,7 +61,13 @@ class WalrusClient:
     """
 
     def __init__(
-        self, publisher_base_url: str, aggregator_base_url: str, timeout: int = 30
+        self,
+        publisher_base_url: str,
+        aggregator_base_url: str,
+        timeout: Union[float, Tuple[float, float]] = (5, 60),
+        session: Optional[requests.Session] = None,
+        pool_size: int = 32,
+        retries: int = 3,
     ):
         """
         Initialize the Walrus client.
@@ -41,25 +75,84 @@ class WalrusClient:
         Args:
             publisher_base_url: Base URL for the publisher service
             aggregator_base_url: Base URL for the aggregator service
-            timeout: Request timeout in seconds
+            timeout: Request timeout in seconds, either a single value or a
+                (connect, read) tuple
+            session: Optional pre-configured requests session to use for all calls.
+                When provided, its adapters are left untouched and closing the
+                client does not close it.
+            pool_size: Maximum number of pooled connections kept per host. Ignored
+                when a session is provided.
+            retries: Number of retries for idempotent (GET/HEAD) requests on
+                transient errors; uploads are never retried after being sent
         """
         self.publisher_base_url = publisher_base_url.rstrip("/")
         self.aggregator_base_url = aggregator_base_url.rstrip("/")
+        self._blobs_url = f"{self.publisher_base_url}/v1/blobs"
+        self._agg_blob_url_tpl = f"{self.aggregator_base_url}/v1/blobs/{{}}"
+        self._agg_by_obj_url_tpl = (
+            f"{self.aggregator_base_url}/v1/blobs/by-object-id/{{}}"
+        )
+        self._octet_headers = {"Content-Type": "application/octet-stream"}
         self.timeout = timeout
+        self.pool_size = pool_size
+        self._owns_session = session is None
+        if session is not None:
+            self._session = session
+        else:
+            self._session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=pool_size,
+                pool_maxsize=pool_size,
+                pool_block=False,
+                max_retries=Retry(
+                    total=retries,
+                    backoff_factor=0.3,
+                    status_forcelist=[429, 502, 503, 504],
+                    allowed_methods=frozenset(["GET", "HEAD"]),
+                    raise_on_status=False,
+                ),
+            )
+            self._session.mount(self.publisher_base_url + "/", adapter)
+            self._session.mount(self.aggregator_base_url + "/", adapter)
+
+    def close(self) -> None:
+        """
+        Close the underlying HTTP session and release pooled connections.
+
+        Sessions passed in by the caller are left open for their owner to close.
+        """
+        if self._owns_session:
+            self._session.close()
+
+    def __enter__(self) -> "WalrusClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # Last resort for clients that were never closed
+        if getattr(self, "_owns_session", False):
+            self.close()
 
     def put_blob(
         self,
-        data: bytes,
+        data: Union[bytes, bytearray, memoryview, str, "os.PathLike[str]", BinaryIO],
         encoding_type: Optional[str] = None,
         epochs: Optional[int] = None,
         deletable: Optional[bool] = None,
         send_object_to: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
-        Upload binary data (a blob) to a publisher.
+        Upload a blob to a publisher.
+
+        The body is always streamed to the publisher: bytes-like data is sent as is,
+        a file path is opened and streamed from disk, and a binary stream is read
+        as the request is sent. A str is always treated as a file path; encode
+        text to bytes before uploading it.
 
         Args:
-            data: Binary data to upload
+            data: Binary data, a path to a file, or a readable binary stream
             encoding_type: The encoding type to use for the blob
             epochs: Number of epochs ahead of the current one to store the blob
             deletable: If true, creates a deletable blob instead of a permanent one
@@ -69,26 +162,46 @@ class WalrusClient:
             JSON response from the server
 
         Raises:
+            FileNotFoundError: If an os.PathLike is given and the file does not exist
+            TypeError: If the data is of an unsupported type, or a str that is not
+                a path to an existing file
             WalrusAPIError: If the API request fails
         """
-        url = f"{self.publisher_base_url}/v1/blobs"
-        headers = {"Content-Type": "application/octet-stream"}
         params = self._build_query_params(
             encoding_type, epochs, deletable, send_object_to
         )
 
-        try:
-            response = requests.put(
-                url, data=data, headers=headers, params=params, timeout=self.timeout
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            if isinstance(data, memoryview):
+                # Let requests size the body in bytes rather than in items
+                data = data.cast("B")
+            if not data:
+                # requests would send an empty bytearray or memoryview chunked
+                data = b""
+            return self._upload(
+                data, self._octet_headers, params, "Error uploading blob"
             )
-            response.raise_for_status()
-            return response.json()
-        except RequestException as e:
-            self._handle_request_error(e, "Error uploading blob")
+
+        if hasattr(data, "read"):
+            return self._upload(
+                data, self._octet_headers, params, "Error uploading blob from stream"
+            )
+
+        if isinstance(data, (str, os.PathLike)):
+            if not os.path.isfile(data):
+                if isinstance(data, str):
+                    raise TypeError(
+                        "str data must be a path to an existing file; "
+                        "encode text to bytes before uploading it"
+                    )
+                raise FileNotFoundError(f"File not found: {data}")
+            return self._upload_file(data, params)
+
+        raise TypeError(f"Unsupported blob data type: {type(data).__name__}")
 
     def put_blob_from_file(
         self,
-        file_path: str,
+        file_path: Union[str, "os.PathLike[str]"],
         encoding_type: Optional[str] = None,
         epochs: Optional[int] = None,
         deletable: Optional[bool] = None,
@@ -111,13 +224,10 @@ class WalrusClient:
             FileNotFoundError: If the file does not exist
             WalrusAPIError: If the API request fails
         """
-        if not os.path.isfile(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
-
-        with open(file_path, "rb") as file:
-            data = file.read()
-
-        return self.put_blob(data, encoding_type, epochs, deletable, send_object_to)
+        params = self._build_query_params(
+            encoding_type, epochs, deletable, send_object_to
+        )
+        return self._upload_file(file_path, params)
 
     def put_blob_from_stream(
         self,
@@ -141,26 +251,63 @@ class WalrusClient:
             JSON response from the server
 
         Raises:
-            ValueError: If the stream is not readable
             WalrusAPIError: If the API request fails
         """
-        if not stream.readable():
-            raise ValueError("Provided stream is not readable")
+        return self.put_blob(stream, encoding_type, epochs, deletable, send_object_to)
 
-        url = f"{self.publisher_base_url}/v1/blobs"
-        headers = {"Content-Type": "application/octet-stream"}
-        params = self._build_query_params(
-            encoding_type, epochs, deletable, send_object_to
-        )
+    def put_blobs(
+        self,
+        items: Iterable[
+            Union[bytes, bytearray, memoryview, str, "os.PathLike[str]", BinaryIO]
+        ],
+        encoding_type: Optional[str] = None,
+        epochs: Optional[int] = None,
+        deletable: Optional[bool] = None,
+        send_object_to: Optional[str] = None,
+        max_workers: int = 8,
+    ) -> List[Dict[str, Any]]:
+        """
+        Upload several blobs to the publisher concurrently.
 
-        try:
-            response = requests.put(
-                url, data=stream, headers=headers, params=params, timeout=self.timeout
-            )
-            response.raise_for_status()
-            return response.json()
-        except RequestException as e:
-            self._handle_request_error(e, "Error uploading blob from stream")
+        Args:
+            items: Blobs to upload, each accepted by put_blob
+            encoding_type: The encoding type to use for every blob
+            epochs: Number of epochs ahead of the current one to store the blobs
+            deletable: If true, creates deletable blobs instead of permanent ones
+            send_object_to: If specified, sends the Blob objects to this Sui address
+            max_workers: Maximum number of concurrent uploads, capped at pool_size
+                unless the client was given its own session
+
+        Returns:
+            JSON responses from the server, in the same order as items
+
+        Raises:
+            WalrusAPIError: If any of the API requests fails
+        """
+
+        def upload(data):
+            return self.put_blob(data, encoding_type, epochs, deletable, send_object_to)
+
+        with ThreadPoolExecutor(self._worker_count(max_workers)) as pool:
+            return list(pool.map(upload, items))
+
+    def get_blobs(self, blob_ids: Iterable[str], max_workers: int = 8) -> List[bytes]:
+        """
+        Retrieve several blobs from the aggregator concurrently by their blob IDs.
+
+        Args:
+            blob_ids: The blob IDs
+            max_workers: Maximum number of concurrent downloads, capped at
+                pool_size unless the client was given its own session
+
+        Returns:
+            Binary contents of the blobs, in the same order as blob_ids
+
+        Raises:
+            WalrusAPIError: If any of the API requests fails
+        """
+        with ThreadPoolExecutor(self._worker_count(max_workers)) as pool:
+            return list(pool.map(self.get_blob, blob_ids))
 
     def get_blob_by_object_id(self, object_id: str) -> bytes:
         """
@@ -175,10 +322,10 @@ class WalrusClient:
         Raises:
             WalrusAPIError: If the API request fails
         """
-        url = f"{self.aggregator_base_url}/v1/blobs/by-object-id/{object_id}"
+        url = self._agg_by_obj_url_tpl.format(object_id)
 
         try:
-            response = requests.get(url, timeout=self.timeout)
+            response = self._session.get(url, timeout=self.timeout)
             response.raise_for_status()
             return response.content
         except RequestException as e:
@@ -199,10 +346,10 @@ class WalrusClient:
         Raises:
             WalrusAPIError: If the API request fails
         """
-        url = f"{self.aggregator_base_url}/v1/blobs/{blob_id}"
+        url = self._agg_blob_url_tpl.format(blob_id)
 
         try:
-            response = requests.get(url, timeout=self.timeout)
+            response = self._session.get(url, timeout=self.timeout)
             response.raise_for_status()
             return response.content
         except RequestException as e:
@@ -218,121 +365,227 @@ class WalrusClient:
             blob_id: The blob ID
 
         Returns:
-            A file-like object (stream) for reading the blob data
+            A file-like object (stream) for reading the blob data. Any
+            Content-Encoding applied by the aggregator is decoded on read.
 
         Raises:
             WalrusAPIError: If the API request fails
         """
-        url = f"{self.aggregator_base_url}/v1/blobs/{blob_id}"
+        url = self._agg_blob_url_tpl.format(blob_id)
         try:
-            response = requests.get(url, stream=True, timeout=self.timeout)
+            response = self._session.get(url, stream=True, timeout=self.timeout)
             response.raise_for_status()
+            response.raw.decode_content = True
             return response.raw
         except RequestException as e:
             self._handle_request_error(
                 e, f"Error retrieving blob as stream by blob ID: {blob_id}"
             )
 
-    def get_blob_as_file(self, blob_id: str, file_path: str) -> None:
+    def iter_blob(self, blob_id: str, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+        """
+        Retrieve a blob from the aggregator by its blob ID as an iterator of chunks.
+
+        The connection is returned to the pool once the iterator is exhausted or
+        closed.
+
+        Args:
+            blob_id: The blob ID
+            chunk_size: Maximum number of bytes per chunk
+
+        Yields:
+            Chunks of the blob's binary content
+
+        Raises:
+            WalrusAPIError: If the API request fails
+        """
+        url = self._agg_blob_url_tpl.format(blob_id)
+        context = f"Error iterating blob by blob ID: {blob_id}"
+        try:
+            response = self._session.get(url, stream=True, timeout=self.timeout)
+            response.raise_for_status()
+        except RequestException as e:
+            self._handle_request_error(e, context)
+
+        with response:
+            try:
+                yield from response.iter_content(chunk_size=chunk_size)
+            except RequestException as e:
+                self._handle_request_error(e, context)
+
+    def get_blob_as_file(
+        self, blob_id: str, file_path: str, chunk_size: int = 1024 * 1024
+    ) -> None:
         """
         Retrieve a blob from the aggregator by its blob ID and save it to a file.
 
         Args:
             blob_id: The blob ID
             file_path: The destination file path where the blob will be saved
+            chunk_size: Number of bytes copied from the response per write
 
         Raises:
             WalrusAPIError: If the API request fails
         """
-        url = f"{self.aggregator_base_url}/v1/blobs/{blob_id}"
+        url = self._agg_blob_url_tpl.format(blob_id)
         try:
-            with requests.get(url, stream=True, timeout=self.timeout) as response:
+            with self._session.get(url, stream=True, timeout=self.timeout) as response:
                 response.raise_for_status()
+                response.raw.decode_content = True
                 with open(file_path, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-        except RequestException as e:
+                    shutil.copyfileobj(response.raw, f, length=chunk_size)
+        except (RequestException, urllib3.exceptions.HTTPError) as e:
             self._handle_request_error(
                 e, f"Error retrieving blob as file by blob ID: {blob_id}"
             )
 
-    def get_blob_metadata(self, blob_id: str) -> Dict[str, str]:
+    def get_blob_metadata(
+        self, blob_id: str, as_dict: bool = False
+    ) -> Union[CaseInsensitiveDict, Dict[str, str]]:
         """
         Retrieve metadata for a blob from the aggregator by making a HEAD request.
 
         Args:
             blob_id: The blob ID
+            as_dict: If true, return a plain dict copy instead of the response headers
 
         Returns:
-            Dictionary containing the response headers
+            Case-insensitive mapping (or dict) containing the response headers
 
         Raises:
             WalrusAPIError: If the API request fails
         """
-        url = f"{self.aggregator_base_url}/v1/blobs/{blob_id}"
+        url = self._agg_blob_url_tpl.format(blob_id)
 
         try:
-            response = requests.head(url, timeout=self.timeout)
+            response = self._session.head(url, timeout=self.timeout)
             response.raise_for_status()
-            return dict(response.headers)
+            return dict(response.headers) if as_dict else response.headers
         except RequestException as e:
             self._handle_request_error(
                 e, f"Error retrieving metadata for blob ID: {blob_id}"
             )
 
-    def _build_query_params(
+    def _worker_count(self, max_workers: int) -> int:
+        """Cap batch concurrency at the size of the connection pool we mounted."""
+        if self._owns_session:
+            return min(max_workers, self.pool_size)
+        return max_workers
+
+    def _upload_file(
+        self,
+        file_path: Union[str, "os.PathLike[str]"],
+        params: Optional[Dict[str, str]],
+    ) -> Dict[str, Any]:
+        """Stream a file from disk to the publisher and return its JSON response."""
+        try:
+            file = open(file_path, "rb", buffering=1024 * 1024)
+        except (FileNotFoundError, IsADirectoryError):
+            raise FileNotFoundError(f"File not found: {file_path}") from None
+
+        with file:
+            # requests would send an empty file chunked; peek() only fills the
+            # read buffer the upload uses anyway
+            body = file if file.peek(1) else b""
+            return self._upload(
+                body, self._octet_headers, params, "Error uploading blob from file"
+            )
+
+    def _upload(
         self,
+        body: Any,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, str]],
+        context: str,
+    ) -> Dict[str, Any]:
+        """Send a blob upload request to the publisher and return its JSON response."""
+        try:
+            response = self._session.put(
+                self._blobs_url,
+                data=body,
+                headers=headers,
+                params=params,
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            return _loads(response.content)
+        except RequestException as e:
+            self._handle_request_error(e, context)
+        except ValueError as e:
+            # Successful status but the body is not JSON (e.g. a proxy error page)
+            raise WalrusAPIError(
+                500,
+                "REQUEST_FAILED",
+                f"Invalid JSON response: {e}",
+                [],
+                context=context,
+            ) from e
+
+    @staticmethod
+    def _build_query_params(
         encoding_type: Optional[str] = None,
         epochs: Optional[int] = None,
         deletable: Optional[bool] = None,
         send_object_to: Optional[str] = None,
-    ) -> Dict[str, str]:
+    ) -> Optional[Dict[str, str]]:
         """Build query parameters for blob upload requests."""
+        if (
+            encoding_type is None
+            and epochs is None
+            and deletable is None
+            and send_object_to is None
+        ):
+            return None
+
         params = {}
         if encoding_type is not None:
             params["encoding_type"] = encoding_type
         if epochs is not None:
             params["epochs"] = str(epochs)
         if deletable is not None:
-            params["deletable"] = "true" if deletable else "false"
+            params["deletable"] = _BOOL_STR[bool(deletable)]
         if send_object_to is not None:
             params["send_object_to"] = send_object_to
         return params
 
-    def _handle_request_error(self, exception: RequestException, context: str) -> None:
+    @staticmethod
+    def _parse_error_json(response: requests.Response) -> Optional[Dict[str, Any]]:
+        """Decode an error response body, returning None unless it is a JSON object."""
+        try:
+            content = response.content
+            if not content:
+                return None
+            error_json = _loads(content)
+        except Exception:
+            return None
+        return error_json if isinstance(error_json, dict) else None
+
+    def _handle_request_error(
+        self,
+        exception: Union[RequestException, urllib3.exceptions.HTTPError],
+        context: str,
+    ) -> None:
         """Handle request exceptions by extracting structured error information."""
-        if hasattr(exception, "response") and exception.response is not None:
-            try:
-                if exception.response.content:
-                    error_json = exception.response.json()
-                    if isinstance(error_json, dict) and "error" in error_json:
-                        err = error_json["error"]
-                        code = err.get("code", exception.response.status_code)
-                        status = err.get("status", "UNKNOWN")
-                        message = err.get("message", "")
-                        details = err.get("details", [])
-                        raise WalrusAPIError(
-                            code, status, message, details, context=context
-                        ) from exception
-
-                # Fall back to HTTP response info
-                code = exception.response.status_code
-                status = exception.response.reason or "UNKNOWN"
-                message = f"HTTP {code}: {status}"
-                raise WalrusAPIError(
-                    code, status, message, [], context=context
-                ) from exception
-
-            except (ValueError, requests.exceptions.JSONDecodeError):
-                code = exception.response.status_code
-                status = exception.response.reason or "UNKNOWN"
-                message = f"HTTP {code}: {status}"
-                raise WalrusAPIError(
-                    code, status, message, [], context=context
-                ) from exception
-        else:
+        response = getattr(exception, "response", None)
+        if response is None:
             # No response available - network error, timeout, etc.
             raise WalrusAPIError(
                 500, "REQUEST_FAILED", str(exception), [], context=context
             ) from exception
+
+        error_json = self._parse_error_json(response)
+        err = error_json.get("error") if error_json else None
+        if isinstance(err, dict):
+            code = err.get("code", response.status_code)
+            status = err.get("status", "UNKNOWN")
+            message = err.get("message", "")
+            details = err.get("details", [])
+            raise WalrusAPIError(
+                code, status, message, details, context=context
+            ) from exception
+
+        # Fall back to HTTP response info
+        code = response.status_code
+        status = response.reason or "UNKNOWN"
+        message = f"HTTP {code}: {status}"
+        raise WalrusAPIError(code, status, message, [], context=context) from exception